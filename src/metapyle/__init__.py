@@ -1,10 +1,12 @@
 """Metapyle - Unified interface for financial time-series data."""
 
 from importlib.metadata import version
+from typing import TYPE_CHECKING
 
 __version__ = version("metapyle")
 
-from metapyle.client import Client
+# Exceptions are cheap to import and commonly needed on their own; the
+# pandas-heavy Client and sources modules load lazily via PEP 562 below.
 from metapyle.exceptions import (
     CatalogError,
     CatalogValidationError,
@@ -15,7 +17,10 @@ from metapyle.exceptions import (
     NoDataError,
     UnknownSourceError,
 )
-from metapyle.sources import BaseSource, FetchRequest, register_source
+
+if TYPE_CHECKING:
+    from metapyle.client import Client
+    from metapyle.sources import BaseSource, FetchRequest, register_source
 
 __all__ = [
     "__version__",
@@ -32,3 +37,27 @@ __all__ = [
     "NoDataError",
     "UnknownSourceError",
 ]
+
+_LAZY_ATTRS = {
+    "Client": "metapyle.client",
+    "BaseSource": "metapyle.sources",
+    "FetchRequest": "metapyle.sources",
+    "register_source": "metapyle.sources",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Resolve pandas-dependent exports on first access (PEP 562)."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    attr = getattr(import_module(module_name), name)
+    globals()[name] = attr  # cache so __getattr__ runs once per name
+    return attr
+
+
+def __dir__() -> list[str]:
+    """Include lazily-resolved names in dir(metapyle)."""
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
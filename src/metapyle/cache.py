@@ -23,10 +23,10 @@ The cache uses two tables:
     - UNIQUE(source, symbol, field, path, start_date, end_date)
 
 **cache_data**
-    Actual time-series data as serialized parquet bytes.
+    Actual time-series data as serialized Arrow IPC (Feather v2) bytes.
 
     - entry_id: INTEGER PRIMARY KEY REFERENCES cache_entries(id)
-    - data: BLOB NOT NULL (parquet-serialized DataFrame)
+    - data: BLOB NOT NULL (Feather-serialized DataFrame, LZ4-compressed)
 
 Cache Key Components
 --------------------
@@ -58,9 +58,12 @@ import io
 import logging
 import os
 import sqlite3
+from collections import OrderedDict
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+from pyarrow import feather
 
 __all__ = ["Cache"]
 
@@ -68,6 +71,12 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_CACHE_PATH = "./cache/data_cache.db"
 
+# Max decoded DataFrames held in the in-process L1 layer
+_L1_MAXSIZE = 64
+
+# (source, symbol, field, path, start_date, end_date)
+_L1Key = tuple[str, str, str | None, str | None, str, str]
+
 
 class Cache:
     """
@@ -75,13 +84,17 @@ class Cache:
 
     Uses two tables:
     - cache_entries: metadata about cached data (source, symbol, field, date range)
-    - cache_data: the actual DataFrame data in Parquet format
+    - cache_data: the actual DataFrame data in Feather (Arrow IPC) format
+
+    A small in-process LRU of decoded DataFrames sits in front of SQLite,
+    so repeat hits on the same key skip the query and deserialization.
 
     Parameters
     ----------
     path : str | None, optional
-        Path to SQLite database file. If None, uses METAPYLE_CACHE_PATH
-        environment variable or defaults to "./cache/data_cache.db".
+        Path to SQLite database file, or ":memory:" for a non-persistent
+        in-memory cache. If None, uses METAPYLE_CACHE_PATH environment
+        variable or defaults to "./cache/data_cache.db".
     enabled : bool, optional
         Whether caching is enabled. If False, put() is a no-op and get()
         always returns None. Default is True.
@@ -95,6 +108,7 @@ class Cache:
     ) -> None:
         self._enabled = enabled
         self._conn: sqlite3.Connection | None = None
+        self._l1: OrderedDict[_L1Key, pd.DataFrame] = OrderedDict()
 
         if not enabled:
             logger.debug("cache_disabled")
@@ -108,11 +122,20 @@ class Cache:
 
     def _initialize_database(self) -> None:
         """Create database and tables if they don't exist."""
-        # Ensure parent directory exists
-        db_path = Path(self._path)
-        db_path.parent.mkdir(parents=True, exist_ok=True)
+        if self._path == ":memory:":
+            self._conn = sqlite3.connect(self._path)
+        else:
+            # Ensure parent directory exists
+            db_path = Path(self._path)
+            db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        self._conn = sqlite3.connect(self._path)
+            self._conn = sqlite3.connect(self._path)
+
+            # WAL + relaxed sync cut fsync cost on writes; mmap lets
+            # reads come straight from the OS page cache
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA mmap_size=268435456")
 
         # Check if migration is needed (old schema without path column)
         cursor = self._conn.execute(
@@ -196,9 +219,19 @@ class Cache:
         if self._conn is None:
             return
 
+        # Drop L1 entries derived from any previous blob for this series
+        series_key = (source, symbol, field, path)
+        for stale in [k for k in self._l1 if k[:4] == series_key]:
+            del self._l1[stale]
+
         try:
-            # Serialize DataFrame to Parquet bytes
-            data_bytes = data.to_parquet()
+            # Serialize DataFrame to Feather (Arrow IPC) bytes; faster to
+            # round-trip than Parquet for the small per-symbol frames stored here
+            buffer = io.BytesIO()
+            feather.write_feather(
+                pa.Table.from_pandas(data, preserve_index=True), buffer, compression="lz4"
+            )
+            data_bytes = buffer.getvalue()
 
             # Delete existing entry if present (for overwrite)
             self._delete_entry(source, symbol, field, path, start_date, end_date)
@@ -258,6 +291,11 @@ class Cache:
 
         Returns data if requested range is a subset of a cached range.
 
+        Returned frames are shallow copies sharing data blocks with the
+        in-memory cache: treat them as read-only. Mutating values in
+        place would corrupt what subsequent hits see; copy first if you
+        need to modify the data.
+
         Parameters
         ----------
         source : str
@@ -284,6 +322,20 @@ class Cache:
         if self._conn is None:
             return None
 
+        # L1: repeat hits skip the SQLite query and Feather decode
+        key: _L1Key = (source, symbol, field, path, start_date, end_date)
+        l1_hit = self._l1.get(key)
+        if l1_hit is not None:
+            self._l1.move_to_end(key)
+            logger.debug(
+                "cache_hit_l1: source=%s, symbol=%s, range=%s/%s",
+                source,
+                symbol,
+                start_date,
+                end_date,
+            )
+            return l1_hit.copy(deep=False)
+
         try:
             # Find a cached entry that covers the requested range
             # field and path can be None, so we need special handling
@@ -364,7 +416,7 @@ class Cache:
             _, cached_start, cached_end, data_bytes = row
 
             # Deserialize DataFrame
-            df = pd.read_parquet(io.BytesIO(data_bytes))
+            df = feather.read_feather(io.BytesIO(data_bytes))
 
             # If requested range is subset, filter the data
             if start_date != cached_start or end_date != cached_end:
@@ -373,6 +425,11 @@ class Cache:
                 end_dt = pd.Timestamp(end_date)
                 df = df[(df.index >= start_dt) & (df.index <= end_dt)]
 
+            # Populate L1 with the decoded (and range-filtered) frame
+            self._l1[key] = df
+            if len(self._l1) > _L1_MAXSIZE:
+                self._l1.popitem(last=False)
+
             logger.debug(
                 "cache_hit: source=%s, symbol=%s, field=%s, path=%s, range=%s/%s",
                 source,
@@ -382,7 +439,7 @@ class Cache:
                 start_date,
                 end_date,
             )
-            return df
+            return df.copy(deep=False)
         except Exception:
             logger.warning(
                 "cache_get_failed: source=%s, symbol=%s, field=%s, path=%s, range=%s/%s",
@@ -396,6 +453,59 @@ class Cache:
             )
             return None
 
+    @staticmethod
+    def make_key(
+        source: str,
+        symbol: str,
+        field: str | None,
+        path: str | None,
+        start_date: str,
+        end_date: str,
+    ) -> _L1Key:
+        """
+        Compose a cache key tuple for use with get_by_key.
+
+        Parameters
+        ----------
+        source : str
+            Data source name.
+        symbol : str
+            Source-specific symbol.
+        field : str | None
+            Field name (can be None for sources without fields).
+        path : str | None
+            Source path (e.g., file path for localfile source).
+        start_date : str
+            Start date in ISO format (YYYY-MM-DD).
+        end_date : str
+            End date in ISO format (YYYY-MM-DD).
+
+        Returns
+        -------
+        tuple
+            Hashable key identifying one cache entry.
+        """
+        return (source, symbol, field, path, start_date, end_date)
+
+    def get_by_key(self, key: _L1Key) -> pd.DataFrame | None:
+        """
+        Retrieve DataFrame from cache by a key built with make_key.
+
+        Same sharing caveat as :meth:`get`: returned frames are
+        read-only shallow copies.
+
+        Parameters
+        ----------
+        key : tuple
+            Key from :meth:`make_key`.
+
+        Returns
+        -------
+        pd.DataFrame | None
+            Cached DataFrame if found, None otherwise.
+        """
+        return self.get(*key)
+
     def clear(self, source: str | None = None) -> None:
         """
         Clear cache entries.
@@ -411,6 +521,8 @@ class Cache:
 
         if source is not None:
             # Clear entries for specific source
+            for stale in [k for k in self._l1 if k[0] == source]:
+                del self._l1[stale]
             self._conn.execute(
                 """
                 DELETE FROM cache_data
@@ -422,6 +534,7 @@ class Cache:
             logger.info("cache_cleared: source=%s", source)
         else:
             # Clear all
+            self._l1.clear()
             self._conn.execute("DELETE FROM cache_data")
             self._conn.execute("DELETE FROM cache_entries")
             logger.info("cache_cleared: all entries")
@@ -1,18 +1,31 @@
 """Catalog system for mapping human-readable names to data sources."""
 
+import copy
 import csv
+import functools
+import hashlib
 import json
 import logging
+import os
+import pickle
+import sys
 from dataclasses import dataclass
+from dataclasses import field as dataclass_field
 from enum import StrEnum, auto
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Self
+from typing import TYPE_CHECKING, Any, Self, TextIO
 
 if TYPE_CHECKING:
     from metapyle.sources.base import SourceRegistry
 
 import yaml
 
+try:
+    # libyaml C bindings, substantially faster than the pure-Python loader
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 from metapyle.exceptions import (
     CatalogValidationError,
     DuplicateNameError,
@@ -25,6 +38,75 @@ logger = logging.getLogger(__name__)
 
 _ALL_COLUMNS = ["my_name", "source", "symbol", "field", "path", "description", "unit"]
 
+
+def _sidecar_dir() -> Path:
+    """Directory for catalog pickle sidecars, under the user cache dir."""
+    base = os.environ.get("XDG_CACHE_HOME")
+    root = Path(base) if base else Path.home() / ".cache"
+    return root / "metapyle" / "catalog"
+
+
+# Upper bound on sidecar files kept in the cache dir; catalogs at
+# now-forgotten paths (renamed files, temp dirs) would otherwise
+# accumulate forever since the same-path cleanup never matches them
+_SIDECAR_CAP = 128
+
+
+def _prune_sidecars(directory: Path) -> None:
+    """Drop the oldest sidecars once the directory exceeds the cap."""
+    entries = sorted(directory.glob("*.pkl"), key=lambda p: p.stat().st_mtime_ns)
+    for old in entries[: max(0, len(entries) - _SIDECAR_CAP)]:
+        old.unlink(missing_ok=True)
+
+
+def _sidecar_path(path: str, mtime_ns: int, size: int) -> Path:
+    """Return the pickle sidecar path for a catalog file at a given state."""
+    path_key = hashlib.blake2b(path.encode(), digest_size=8).hexdigest()
+    state_key = hashlib.blake2b(f"{mtime_ns}:{size}".encode(), digest_size=8).hexdigest()
+    return _sidecar_dir() / f"{path_key}.{state_key}.pkl"
+
+
+@functools.lru_cache(maxsize=128)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a YAML catalog file, memoized on (path, mtime_ns, size).
+
+    The stat fields make the key self-invalidating: rewriting a file
+    changes its mtime/size and triggers a fresh parse. Across processes,
+    a pickle sidecar under the user cache dir (``~/.cache/metapyle/
+    catalog/``, keyed by digests of the path and its stat state) is tried
+    before parsing; pickle load is much faster than a YAML parse.
+    Sidecar failures are non-fatal and fall back to parsing. Callers
+    must deep-copy the returned structure before mutating it.
+    """
+    sidecar = _sidecar_path(path, mtime_ns, size)
+    if sidecar.exists():
+        try:
+            with open(sidecar, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            logger.warning("catalog_sidecar_load_failed: path=%s", sidecar, exc_info=True)
+
+    with open(path) as f:
+        parsed = yaml.load(f, Loader=_SafeLoader)
+
+    try:
+        sidecar.parent.mkdir(parents=True, exist_ok=True)
+        # Drop sidecars for older states of this file before writing; the
+        # path digest prefix confines the glob to this catalog's entries
+        path_key = sidecar.name.partition(".")[0]
+        for stale in sidecar.parent.glob(f"{path_key}.*.pkl"):
+            stale.unlink(missing_ok=True)
+        with open(sidecar, "wb") as f:
+            pickle.dump(parsed, f, protocol=5)
+        _prune_sidecars(sidecar.parent)
+        logger.debug("catalog_sidecar_written: path=%s", sidecar)
+    except Exception:
+        logger.debug("catalog_sidecar_write_failed: path=%s", sidecar, exc_info=True)
+
+    return parsed
+
+
 _SOURCE_COLUMNS: dict[str, list[str]] = {
     "bloomberg": ["my_name", "source", "symbol", "field", "description", "unit"],
     "gsquant": ["my_name", "source", "symbol", "field", "description", "unit"],
@@ -123,6 +205,12 @@ class CatalogEntry:
         Unit of measurement (e.g., "USD billions", "points").
     params : dict[str, Any] | None, optional
         Additional source-specific parameters (e.g., tenor, deltaStrike for gs-quant).
+
+    Attributes
+    ----------
+    cache_key : tuple[str, str, str | None, str | None]
+        Precomputed ``(source, symbol, field, path)`` prefix of the cache
+        key, built once at construction so hot paths avoid re-tupling.
     """
 
     my_name: str
@@ -133,6 +221,12 @@ class CatalogEntry:
     description: str | None = None
     unit: str | None = None
     params: dict[str, Any] | None = None
+    cache_key: tuple[str, str, str | None, str | None] = dataclass_field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "cache_key", (self.source, self.symbol, self.field, self.path))
 
 
 class Catalog:
@@ -149,14 +243,15 @@ class Catalog:
         self._entries = entries
 
     @classmethod
-    def from_yaml(cls, paths: str | Path | list[str | Path]) -> Self:
+    def from_yaml(cls, paths: str | Path | TextIO | list[str | Path | TextIO]) -> Self:
         """
-        Load catalog entries from one or more YAML files.
+        Load catalog entries from one or more YAML files or streams.
 
         Parameters
         ----------
-        paths : str | Path | list[str | Path]
-            Path or list of paths to YAML catalog files.
+        paths : str | Path | TextIO | list[str | Path | TextIO]
+            Path, open text stream (anything with a ``read`` method, e.g.
+            ``io.StringIO``), or list thereof.
 
         Returns
         -------
@@ -170,30 +265,43 @@ class Catalog:
         DuplicateNameError
             If the same my_name appears in multiple entries.
         """
-        if isinstance(paths, (str, Path)):
-            paths = [paths]
+        if isinstance(paths, (str, Path)) or hasattr(paths, "read"):
+            paths = [paths]  # type: ignore[list-item]
 
         entries: dict[str, CatalogEntry] = {}
 
         for path in paths:
-            file_path = Path(path)
-
-            if not file_path.exists():
-                raise CatalogValidationError(f"Catalog file not found: {path}")
-
-            logger.info("loading_catalog: path=%s", path)
-
-            try:
-                with open(file_path) as f:
-                    raw_entries = yaml.safe_load(f)
-            except yaml.YAMLError as e:
-                raise CatalogValidationError(f"Malformed YAML in {path}: {e}") from e
+            if hasattr(path, "read"):
+                # In-memory stream: parse directly, no stat-keyed caching
+                source_file: str | Path = "<stream>"
+                try:
+                    raw_entries = yaml.load(path, Loader=_SafeLoader)
+                except yaml.YAMLError as e:
+                    raise CatalogValidationError(f"Malformed YAML in {source_file}: {e}") from e
+            else:
+                source_file = path
+                file_path = Path(path)
+
+                if not file_path.exists():
+                    raise CatalogValidationError(f"Catalog file not found: {path}")
+
+                logger.info("loading_catalog: path=%s", path)
+
+                try:
+                    stat = file_path.stat()
+                    raw_entries = copy.deepcopy(
+                        _load_yaml_cached(str(file_path), stat.st_mtime_ns, stat.st_size)
+                    )
+                except yaml.YAMLError as e:
+                    raise CatalogValidationError(f"Malformed YAML in {path}: {e}") from e
 
             if not isinstance(raw_entries, list):
-                raise CatalogValidationError(f"Catalog file {path} must contain a list of entries")
+                raise CatalogValidationError(
+                    f"Catalog file {source_file} must contain a list of entries"
+                )
 
             for raw in raw_entries:
-                entry = cls._parse_entry(raw, path)
+                entry = cls._parse_entry(raw, source_file)
 
                 if entry.my_name in entries:
                     raise DuplicateNameError(f"Duplicate catalog name: {entry.my_name}")
@@ -203,6 +311,44 @@ class Catalog:
         logger.info("catalog_loaded: entries=%d", len(entries))
         return cls(entries)
 
+    @classmethod
+    def from_entries(cls, entries: list[dict[str, Any]]) -> Self:
+        """
+        Build a catalog from already-parsed entry dictionaries.
+
+        Bypasses file I/O and YAML parsing entirely; each dict uses the
+        same keys as a YAML catalog entry (my_name, source, symbol, ...).
+
+        Parameters
+        ----------
+        entries : list[dict[str, Any]]
+            Raw catalog entries.
+
+        Returns
+        -------
+        Catalog
+            Catalog instance with the given entries.
+
+        Raises
+        ------
+        CatalogValidationError
+            If entries are missing required fields or fail source rules.
+        DuplicateNameError
+            If the same my_name appears in multiple entries.
+        """
+        parsed: dict[str, CatalogEntry] = {}
+
+        for raw in entries:
+            entry = cls._parse_entry(raw, "<entries>")
+
+            if entry.my_name in parsed:
+                raise DuplicateNameError(f"Duplicate catalog name: {entry.my_name}")
+
+            parsed[entry.my_name] = entry
+
+        logger.info("catalog_loaded: entries=%d", len(parsed))
+        return cls(parsed)
+
     @classmethod
     def from_csv(cls, paths: str | Path | list[str | Path]) -> Self:
         """
@@ -279,8 +425,8 @@ class Catalog:
 
                     # Create entry (empty strings become None)
                     entry = CatalogEntry(
-                        my_name=my_name,
-                        source=row.get("source", ""),
+                        my_name=sys.intern(my_name),
+                        source=sys.intern(row.get("source", "")),
                         symbol=row.get("symbol", ""),
                         field=row.get("field") or None,
                         path=row.get("path") or None,
@@ -313,9 +459,10 @@ class Catalog:
             if field not in raw:
                 raise CatalogValidationError(f"Missing required field '{field}' in {source_file}")
 
+        # Interned keys let dict lookups short-circuit on pointer equality
         entry = CatalogEntry(
-            my_name=raw["my_name"],
-            source=raw["source"],
+            my_name=sys.intern(raw["my_name"]),
+            source=sys.intern(raw["source"]),
             symbol=raw["symbol"],
             field=raw.get("field"),
             path=raw.get("path"),
@@ -341,6 +488,29 @@ class Catalog:
             )
         return self._entries[name]
 
+    def get_many(self, names: list[str]) -> list[CatalogEntry]:
+        """
+        Resolve several catalog names in one pass.
+
+        Parameters
+        ----------
+        names : list[str]
+            Catalog names to resolve.
+
+        Returns
+        -------
+        list[CatalogEntry]
+            Entries in the same order as names.
+
+        Raises
+        ------
+        NameNotFoundError
+            If any name is not in the catalog.
+        """
+        entries = self._entries
+        # Plain dict lookup for hits; delegate misses to get() for its error
+        return [entries[name] if name in entries else self.get(name) for name in names]
+
     def list_names(self) -> list[str]:
         """List all catalog entry names."""
         return list(self._entries.keys())
@@ -2,10 +2,11 @@
 
 import datetime
 import logging
-from itertools import groupby
+from functools import lru_cache, reduce
 from pathlib import Path
-from typing import Any, Self
+from typing import Any, Self, TextIO
 
+import numpy as np
 import pandas as pd
 
 from metapyle.cache import Cache
@@ -22,6 +23,19 @@ __all__ = ["Client"]
 
 logger = logging.getLogger(__name__)
 
+_VALID_OUTPUT_FORMATS = frozenset({"wide", "long"})
+
+
+@lru_cache(maxsize=256)
+def _bday_gap(actual_end: pd.Timestamp, threshold: pd.Timestamp) -> int:
+    """
+    Business days from actual_end up to and including the stale threshold.
+
+    Memoized: in a multi-symbol request, every stale symbol from the same
+    source typically shares the same (actual_end, threshold) pair.
+    """
+    return len(pd.bdate_range(actual_end, threshold))
+
 
 class Client:
     """
@@ -32,8 +46,9 @@ class Client:
 
     Parameters
     ----------
-    catalog : str | Path | list[str | Path]
-        Path or list of paths to YAML catalog files.
+    catalog : str | Path | TextIO | Catalog | list[str | Path | TextIO]
+        Path or list of paths to YAML catalog files, an open text stream
+        of YAML content, or an already-built Catalog instance.
     cache_path : str | None, optional
         Path to SQLite cache database. If None, uses default path.
     cache_enabled : bool, optional
@@ -47,13 +62,16 @@ class Client:
 
     def __init__(
         self,
-        catalog: str | Path | list[str | Path],
+        catalog: str | Path | TextIO | Catalog | list[str | Path | TextIO],
         *,
         cache_path: str | None = None,
         cache_enabled: bool = True,
     ) -> None:
         self._registry: SourceRegistry = _global_registry
-        self._catalog = Catalog.from_yaml(catalog)
+        if isinstance(catalog, Catalog):
+            self._catalog = catalog
+        else:
+            self._catalog = Catalog.from_yaml(catalog)
         self._catalog.validate_sources(self._registry)
         self._cache = Cache(path=cache_path, enabled=cache_enabled)
 
@@ -63,6 +81,46 @@ class Client:
             cache_enabled,
         )
 
+    @classmethod
+    def from_entries(
+        cls,
+        entries: list[dict[str, Any]],
+        *,
+        cache_path: str | None = None,
+        cache_enabled: bool = True,
+    ) -> Self:
+        """
+        Build a client from already-parsed catalog entry dictionaries.
+
+        Skips YAML files entirely; each dict uses the same keys as a YAML
+        catalog entry. Useful for tests and programmatic catalogs.
+
+        Parameters
+        ----------
+        entries : list[dict[str, Any]]
+            Raw catalog entries.
+        cache_path : str | None, optional
+            Path to SQLite cache database. If None, uses default path.
+        cache_enabled : bool, optional
+            Whether caching is enabled. Default is True.
+
+        Returns
+        -------
+        Client
+            Client backed by the given entries.
+
+        Examples
+        --------
+        >>> client = Client.from_entries(
+        ...     [{"my_name": "gdp_us", "source": "macrobond", "symbol": "usgdp"}]
+        ... )
+        """
+        return cls(
+            Catalog.from_entries(entries),
+            cache_path=cache_path,
+            cache_enabled=cache_enabled,
+        )
+
     def get(
         self,
         names: list[str],
@@ -136,12 +194,16 @@ class Client:
         ...     unified_options={"frequency": SeriesFrequency.QUARTERLY},
         ... )
         """
+        # Validate up front, before any fetch or cache work happens
+        if output_format not in _VALID_OUTPUT_FORMATS:
+            raise ValueError(f"output_format must be 'wide' or 'long', got '{output_format}'")
+
         # Default end to today if not specified
         if end is None:
             end = datetime.date.today().isoformat()
 
         # Resolve entries (raises NameNotFoundError if not found)
-        entries = [self._catalog.get(name) for name in names]
+        entries = self._catalog.get_many(names)
 
         if frequency is not None:
             logger.info(
@@ -165,14 +227,7 @@ class Client:
                 continue
 
             if use_cache:
-                cached = self._cache.get(
-                    source=entry.source,
-                    symbol=entry.symbol,
-                    field=entry.field,
-                    path=entry.path,
-                    start_date=start,
-                    end_date=end,
-                )
+                cached = self._cache.get(*entry.cache_key, start, end)
                 if cached is not None:
                     logger.debug(
                         "fetch_from_cache: symbol=%s, rows=%d",
@@ -186,12 +241,14 @@ class Client:
 
         # Batch fetch uncached entries grouped by source
         if uncached_entries:
-            # Sort by source for groupby
-            sorted_entries = sorted(uncached_entries, key=lambda e: e.source)
+            # Parse the staleness threshold once; it is constant for the request
+            stale_threshold = (pd.Timestamp(end) - pd.offsets.BDay(1)).tz_localize(None)
 
-            for source_name, group in groupby(sorted_entries, key=lambda e: e.source):
-                group_entries = list(group)
+            groups: dict[str, list[CatalogEntry]] = {}
+            for entry in uncached_entries:
+                groups.setdefault(entry.source, []).append(entry)
 
+            for source_name, group_entries in groups.items():
                 # Build FetchRequest list for this source
                 requests = [
                     FetchRequest(
@@ -239,14 +296,12 @@ class Client:
                         # Check for stale data (actual end > 1 business day before requested)
                         actual_end = col_df.index.max()
                         # Ensure tz-naive comparison
-                        threshold = (pd.Timestamp(end) - pd.offsets.BDay(1)).tz_localize(None)
                         actual_end_naive = (
                             actual_end.tz_localize(None) if actual_end.tzinfo else actual_end
                         )
-                        if actual_end_naive < threshold:
-                            gap_bdays = (
-                                len(pd.bdate_range(actual_end_naive, threshold)) - 1 + 1
-                            )  # +1 since threshold is already 1 BD behind
+                        if actual_end_naive < stale_threshold:
+                            # Gap counts the threshold itself, which is already 1 BD behind
+                            gap_bdays = _bday_gap(actual_end_naive, stale_threshold)
                             logger.warning(
                                 "stale_data: symbol=%s, actual_end=%s, requested_end=%s, gap_bdays=%d",
                                 entry.my_name,
@@ -258,15 +313,7 @@ class Client:
                         # Cache the column (skip for unified macrobond - server-side transform)
                         skip_cache = unified and entry.source == "macrobond"
                         if use_cache and not skip_cache:
-                            self._cache.put(
-                                source=entry.source,
-                                symbol=entry.symbol,
-                                field=entry.field,
-                                path=entry.path,
-                                start_date=start,
-                                end_date=end,
-                                data=col_df,
-                            )
+                            self._cache.put(*entry.cache_key, start, end, col_df)
 
                         dfs[entry.my_name] = col_df
                     else:
@@ -302,8 +349,6 @@ class Client:
             from metapyle.processing import wide_to_long
 
             return wide_to_long(result)
-        elif output_format != "wide":
-            raise ValueError(f"output_format must be 'wide' or 'long', got '{output_format}'")
 
         return result
 
@@ -418,20 +463,48 @@ class Client:
         if not dfs:
             return pd.DataFrame()
 
-        # Rename first column to my_name and normalize each DataFrame
-        renamed: list[pd.DataFrame] = []
+        # Extract the first column of each frame as a Series keyed by
+        # my_name; renaming happens implicitly at assembly time, so no
+        # per-frame copy-and-rename pass is needed.
+        series: dict[str, pd.Series] = {}
         for my_name, df in dfs.items():
-            # Take first column regardless of name, rename to my_name
-            col = df.columns[0]
-            df_renamed = df[[col]].rename(columns={col: my_name})
             # Defensive normalization (sources should already normalize,
             # but this ensures safe concat even with misbehaving sources)
-            renamed.append(normalize_dataframe(df_renamed))
-
-        combined = pd.concat(renamed, axis=1)
+            series[my_name] = normalize_dataframe(df).iloc[:, 0]
+
+        # Single series: nothing to merge or reorder
+        if len(series) == 1:
+            my_name, s = next(iter(series.items()))
+            return s.to_frame(my_name)
+
+        # Merge indexes via a sorted int64 union instead of concat's
+        # hash-based outer join; per-source indexes arrive sorted, so
+        # np.union1d on the underlying epoch values is a linear merge.
+        values = list(series.values())
+        first_idx = values[0].index
+        if all(s.index.equals(first_idx) for s in values[1:]):
+            if len({s.dtype for s in values}) == 1:
+                # Aligned same-dtype series: one memcpy instead of a
+                # block-manager pass per frame
+                arr = np.column_stack([s.to_numpy() for s in values])
+                combined = pd.DataFrame(arr, index=first_idx, columns=list(series.keys()))
+            else:
+                # Mixed dtypes: concat preserves per-column dtypes
+                combined = pd.concat(series, axis=1)
+        elif all(s.index.dtype == first_idx.dtype for s in values[1:]):
+            merged = reduce(np.union1d, (s.index.asi8 for s in values))
+            target = pd.DatetimeIndex(
+                merged.view(f"datetime64[{first_idx.unit}]"), tz="UTC", name="date"
+            )
+            combined = pd.DataFrame({my_name: s.reindex(target) for my_name, s in series.items()})
+        else:
+            # Mixed index resolutions: let pandas handle the alignment
+            combined = pd.concat(series, axis=1)
 
-        # Preserve input order
+        # Preserve input order; skip the reindex copy when already ordered
         ordered_cols = [name for name in names if name in combined.columns]
+        if ordered_cols == list(combined.columns):
+            return combined
         return combined[ordered_cols]
 
     def clear_cache(self, *, source: str | None = None) -> None:
@@ -2,6 +2,7 @@
 
 import logging
 
+import numpy as np
 import pandas as pd
 
 __all__ = ["align_to_frequency", "wide_to_long"]
@@ -51,6 +52,14 @@ def align_to_frequency(
         target_frequency,
     )
 
+    # Identity short-circuit: already on the target frequency, nothing to do
+    freq = df.index.freqstr
+    if freq is None and len(df) >= 3:
+        freq = pd.infer_freq(df.index)
+    if freq == target_frequency:
+        logger.debug("alignment_skipped: already at target frequency")
+        return df
+
     # Resample using last value for downsampling, forward-fill for upsampling
     resampled = df.resample(target_frequency).last()
 
@@ -89,6 +98,7 @@ def wide_to_long(
     -------
     pd.DataFrame
         Long DataFrame with columns: [date_col, symbol_col, value_col].
+        The symbol column is categorical, with one category per input column.
 
     Examples
     --------
@@ -100,33 +110,49 @@ def wide_to_long(
     >>> long = wide_to_long(df)
     >>> long
             date symbol  value
-    0 2024-01-01    SPX  100.0
-    1 2024-01-02    SPX  101.0
-    2 2024-01-01    VIX   15.0
-    3 2024-01-02    VIX   16.0
+    0 2024-01-01    SPX    100
+    1 2024-01-02    SPX    101
+    2 2024-01-01    VIX     15
+    3 2024-01-02    VIX     16
     """
     logger.debug("wide_to_long: wide_shape=%s", df.shape)
 
     if df.empty:
-        return pd.DataFrame(columns=[date_col, symbol_col, value_col])
-
-    # Reset index to get date as column
-    df_reset = df.reset_index()
-    date_column = df_reset.columns[0]  # First column is the former index
-
-    # Melt from wide to tall
-    tall = pd.melt(
-        df_reset,
-        id_vars=[date_column],
-        var_name=symbol_col,
-        value_name=value_col,
+        # Typed zero-row frame: skips the reshape below and keeps the date
+        # column on the input index dtype instead of melt's object columns.
+        return pd.DataFrame(
+            {
+                date_col: pd.Index([], dtype=df.index.dtype),
+                symbol_col: np.empty(0, dtype=object),
+                value_col: np.empty(0, dtype="float64"),
+            }
+        )
+
+    # Emit symbol blocks in sorted order with dates ascending inside each
+    # block, so the reshape below produces sorted output without a final sort.
+    frame = df if df.index.is_monotonic_increasing else df.sort_index()
+    columns = frame.columns.to_numpy()
+    order = np.argsort(columns, kind="stable")
+    if not np.array_equal(order, np.arange(len(order))):
+        frame = frame.iloc[:, order]
+        columns = columns[order]
+
+    # Column-major ravel reads one symbol block at a time; asfortranarray is a
+    # no-op view when the frame already stores a single F-contiguous block.
+    nrows, ncols = frame.shape
+    values = np.asfortranarray(frame.to_numpy(copy=False)).ravel(order="F")
+    # Index.take keeps timezone-aware datetime dtype, unlike tiling raw values
+    dates = frame.index.take(np.tile(np.arange(nrows), ncols))
+    # Categorical codes store one small int per row instead of a string
+    # reference; the symbol names live once in the categories array.
+    symbols = pd.Categorical.from_codes(
+        np.repeat(np.arange(ncols), nrows), categories=frame.columns
     )
 
-    # Rename date column
-    tall = tall.rename(columns={date_column: date_col})
-
-    # Sort by symbol then date
-    tall = tall.sort_values([symbol_col, date_col]).reset_index(drop=True)
+    tall = pd.DataFrame(
+        {date_col: dates, symbol_col: symbols, value_col: values},
+        copy=False,
+    )
 
     logger.debug("wide_to_long_complete: long_shape=%s", tall.shape)
     return tall
@@ -84,6 +84,16 @@ def normalize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     ValueError
         If index cannot be converted to DatetimeIndex.
     """
+    # Fast path: index already normalized, nothing to do
+    idx = df.index
+    if (
+        isinstance(idx, pd.DatetimeIndex)
+        and idx.tz is not None
+        and str(idx.tz) == "UTC"
+        and idx.name == "date"
+    ):
+        return df
+
     # Convert to DatetimeIndex if needed
     if not isinstance(df.index, pd.DatetimeIndex):
         try:
@@ -172,6 +182,8 @@ class SourceRegistry:
     Caches instantiated adapters for reuse.
     """
 
+    __slots__ = ("_sources", "_instances")
+
     def __init__(self) -> None:
         self._sources: dict[str, type[BaseSource]] = {}
         self._instances: dict[str, BaseSource] = {}
@@ -208,16 +220,19 @@ class SourceRegistry:
         UnknownSourceError
             If no source is registered with the given name.
         """
-        if name not in self._sources:
+        sources = self._sources
+        instances = self._instances
+
+        if name not in sources:
             raise UnknownSourceError(
-                f"Unknown source: {name}. "
-                f"Available sources: {', '.join(self._sources.keys()) or 'none'}"
+                f"Unknown source: {name}. Available sources: {', '.join(sources.keys()) or 'none'}"
             )
 
-        if name not in self._instances:
-            self._instances[name] = self._sources[name]()
+        instance = instances.get(name)
+        if instance is None:
+            instance = instances[name] = sources[name]()
 
-        return self._instances[name]
+        return instance
 
     def list_sources(self) -> list[str]:
         """
@@ -115,7 +115,8 @@ class BloombergSource(BaseSource):
 
         # Rename columns from MultiIndex (ticker, field) to "ticker::field"
         if isinstance(df.columns, pd.MultiIndex):
-            df.columns = [make_column_name(ticker, field) for ticker, field in df.columns]
+            # Same result as make_column_name per tuple, joined at C speed
+            df.columns = df.columns.map("::".join)
         else:
             # Single ticker/field case
             req = requests[0]
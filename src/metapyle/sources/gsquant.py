@@ -232,9 +232,10 @@ class GSQuantSource(BaseSource):
         if not result_dfs:
             return pd.DataFrame()
 
-        result = result_dfs[0]
-        for df in result_dfs[1:]:
-            result = result.join(df, how="outer")
+        # Single outer-join concat; pairwise joins rebuild the frame per dataset
+        result = (
+            result_dfs[0] if len(result_dfs) == 1 else pd.concat(result_dfs, axis=1, join="outer")
+        )
 
         result = normalize_dataframe(result)
 
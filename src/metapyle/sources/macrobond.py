@@ -148,10 +148,9 @@ class MacrobondSource(BaseSource):
             logger.warning("fetch_empty: symbols=%s", symbols)
             raise NoDataError(f"No data returned for {symbols}")
 
-        # Merge all series on index
-        result = dfs[0]
-        for df in dfs[1:]:
-            result = result.join(df, how="outer")
+        # Merge all series on index in one pass; pairwise joins rebuild
+        # the frame once per series
+        result = dfs[0] if len(dfs) == 1 else pd.concat(dfs, axis=1, join="outer")
 
         # Filter by date range
         start_dt = pd.Timestamp(start)
@@ -1,8 +1,22 @@
 """Shared pytest fixtures and configuration."""
 
+from collections.abc import Iterator
+
 import pytest
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_cache_home(tmp_path_factory: pytest.TempPathFactory) -> Iterator[None]:
+    """Point XDG_CACHE_HOME at a temp dir so tests don't litter ~/.cache.
+
+    Every path-based catalog load writes a pickle sidecar under the user
+    cache dir; tmp_path catalogs would otherwise leave one behind per run.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache_home")))
+        yield
+
+
 def pytest_addoption(parser: pytest.Parser) -> None:
     """Add --run-private option for private series tests."""
     parser.addoption(
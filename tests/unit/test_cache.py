@@ -31,6 +31,19 @@ class TestCacheInitialization:
         assert env_path.exists()
         cache.close()
 
+    def test_cache_in_memory(self) -> None:
+        """Cache supports a non-persistent :memory: database."""
+        cache = Cache(path=":memory:")
+
+        dates = pd.date_range("2024-01-01", "2024-01-05", freq="D")
+        df = pd.DataFrame({"value": [1.0, 2.0, 3.0, 4.0, 5.0]}, index=dates)
+        cache.put("source", "SYM", None, None, "2024-01-01", "2024-01-05", df)
+
+        result = cache.get("source", "SYM", None, None, "2024-01-01", "2024-01-05")
+        assert result is not None
+        assert len(result) == 5
+        cache.close()
+
     def test_cache_disabled(self, tmp_path: Path) -> None:
         """Disabled cache does not create database or store data."""
         db_path = tmp_path / "disabled_cache.db"
@@ -73,6 +86,28 @@ class TestCachePutAndGet:
         assert list(result["value"]) == [1.0, 2.0, 3.0, 4.0, 5.0]
         cache.close()
 
+    def test_cache_l1_serves_repeat_hits(self, tmp_path: Path) -> None:
+        """Repeat gets for the same key are served from the in-process L1."""
+        db_path = tmp_path / "test_cache.db"
+        cache = Cache(path=str(db_path))
+
+        dates = pd.date_range("2024-01-01", "2024-01-05", freq="D")
+        df = pd.DataFrame({"value": [1.0, 2.0, 3.0, 4.0, 5.0]}, index=dates)
+        cache.put("test_source", "TEST_SYM", "close", None, "2024-01-01", "2024-01-05", df)
+
+        first = cache.get("test_source", "TEST_SYM", "close", None, "2024-01-01", "2024-01-05")
+        assert len(cache._l1) == 1
+
+        second = cache.get("test_source", "TEST_SYM", "close", None, "2024-01-01", "2024-01-05")
+
+        assert first is not None and second is not None
+        pd.testing.assert_frame_equal(first, second)
+
+        # clear() must invalidate the L1 as well
+        cache.clear()
+        assert len(cache._l1) == 0
+        cache.close()
+
     def test_cache_get_returns_none_for_miss(self, tmp_path: Path) -> None:
         """Cache returns None when data is not found."""
         db_path = tmp_path / "test_cache.db"
@@ -1,5 +1,6 @@
 """Unit tests for Catalog and CatalogEntry."""
 
+import io
 from pathlib import Path
 
 import pytest
@@ -469,6 +470,60 @@ def test_catalog_load_duplicate_across_files(tmp_path: Path) -> None:
         Catalog.from_yaml([str(file1), str(file2)])
 
 
+def test_catalog_from_entries() -> None:
+    """Catalog can be built from already-parsed entry dictionaries."""
+    catalog = Catalog.from_entries(
+        [
+            {
+                "my_name": "GDP_US",
+                "source": "bloomberg",
+                "symbol": "GDP CUR$ Index",
+                "field": "PX_LAST",
+            },
+            {
+                "my_name": "gdp_local",
+                "source": "localfile",
+                "symbol": "gdp",
+                "path": "/data/gdp.csv",
+            },
+        ]
+    )
+
+    assert len(catalog) == 2
+    assert catalog.get("GDP_US").field == "PX_LAST"
+    assert catalog.get("gdp_local").path == "/data/gdp.csv"
+
+
+def test_catalog_from_entries_duplicate_names() -> None:
+    """Catalog.from_entries raises DuplicateNameError for duplicate my_name."""
+    entries = [
+        {
+            "my_name": "GDP_US",
+            "source": "bloomberg",
+            "symbol": "GDP CUR$ Index",
+            "field": "PX_LAST",
+        },
+        {"my_name": "GDP_US", "source": "localfile", "symbol": "gdp", "path": "/data/gdp.csv"},
+    ]
+
+    with pytest.raises(DuplicateNameError, match="GDP_US"):
+        Catalog.from_entries(entries)
+
+
+def test_catalog_from_yaml_stream() -> None:
+    """Catalog.from_yaml accepts an in-memory text stream."""
+    yaml_content = """
+- my_name: GDP_US
+  source: bloomberg
+  symbol: GDP CUR$ Index
+  field: PX_LAST
+"""
+    catalog = Catalog.from_yaml(io.StringIO(yaml_content))
+
+    assert len(catalog) == 1
+    assert catalog.get("GDP_US").symbol == "GDP CUR$ Index"
+
+
 def test_catalog_get_unknown_name() -> None:
     """Catalog raises NameNotFoundError for unknown name."""
     catalog = Catalog({})
@@ -477,6 +532,23 @@ def test_catalog_get_unknown_name() -> None:
         catalog.get("UNKNOWN")
 
 
+def test_catalog_get_many() -> None:
+    """Catalog.get_many resolves names in input order."""
+    catalog = Catalog.from_entries(
+        [
+            {"my_name": "a", "source": "macrobond", "symbol": "sym_a"},
+            {"my_name": "b", "source": "macrobond", "symbol": "sym_b"},
+        ]
+    )
+
+    entries = catalog.get_many(["b", "a"])
+
+    assert [entry.my_name for entry in entries] == ["b", "a"]
+
+    with pytest.raises(NameNotFoundError, match="UNKNOWN"):
+        catalog.get_many(["a", "UNKNOWN"])
+
+
 def test_catalog_list_names(tmp_path: Path) -> None:
     """Catalog can list all entry names."""
     yaml_content = """
@@ -1306,3 +1378,25 @@ def test_catalog_yaml_to_csv_roundtrip(tmp_path: Path) -> None:
         assert reload_entry.path == orig_entry.path
         assert reload_entry.description == orig_entry.description
         assert reload_entry.unit == orig_entry.unit
+
+
+def test_sidecar_dir_bounded(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Sidecar cache dir stays bounded as catalogs at new paths are loaded."""
+    from metapyle import catalog as catalog_module
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache_home"))
+    monkeypatch.setattr(catalog_module, "_SIDECAR_CAP", 5)
+
+    yaml_content = """
+- my_name: TEST1
+  source: bloomberg
+  symbol: TEST Index
+  field: PX_LAST
+"""
+    for i in range(10):
+        yaml_file = tmp_path / f"catalog_{i}.yaml"
+        yaml_file.write_text(yaml_content)
+        Catalog.from_yaml(yaml_file)
+
+    sidecars = list((tmp_path / "cache_home" / "metapyle" / "catalog").glob("*.pkl"))
+    assert len(sidecars) <= 5
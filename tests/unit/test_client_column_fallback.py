@@ -2,6 +2,7 @@
 
 import pytest
 
+from metapyle import Client
 from metapyle.exceptions import CatalogValidationError
 from metapyle.sources.base import make_column_name
 
@@ -19,27 +20,22 @@ class TestColumnLookupFallback:
         result = make_column_name("usgdp", None)
         assert result == "usgdp"
 
-    def test_localfile_with_field_is_rejected(self, tmp_path) -> None:
+    def test_localfile_with_field_is_rejected(self) -> None:
         """Localfile entries must not have field set.
 
         Field attribute is not used by localfile source, so it should
         be rejected during catalog validation to prevent confusion.
+        Validation fails before any data is read, so no files are needed.
         """
-        from metapyle import Client
-
-        # Create a CSV file
-        csv_file = tmp_path / "data.csv"
-        csv_file.write_text("date,usgdp\n2024-01-01,100\n2024-01-02,101\n2024-01-03,102\n")
-
-        # Catalog has field defined (invalid for localfile)
-        catalog = tmp_path / "catalog.yaml"
-        catalog.write_text(f"""
-- my_name: us_gdp
-  source: localfile
-  symbol: usgdp
-  field: some_field_invalid_for_localfile
-  path: {csv_file}
-""")
+        entries = [
+            {
+                "my_name": "us_gdp",
+                "source": "localfile",
+                "symbol": "usgdp",
+                "field": "some_field_invalid_for_localfile",
+                "path": "/data/data.csv",
+            }
+        ]
 
         with pytest.raises(CatalogValidationError, match="localfile.*field"):
-            Client(catalog=catalog, cache_enabled=False)
+            Client.from_entries(entries, cache_enabled=False)
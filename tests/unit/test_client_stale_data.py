@@ -2,6 +2,7 @@
 
 import logging
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -9,12 +10,29 @@ from metapyle import Client
 from metapyle.sources.base import BaseSource, FetchRequest, register_source
 
 
+def _stale_records(caplog: pytest.LogCaptureFixture) -> list[logging.LogRecord]:
+    """Collect stale_data warning records without formatting the log buffer."""
+    return [r for r in caplog.records if r.msg.startswith("stale_data")]
+
+
+_ARANGE_CACHE: dict[int, np.ndarray] = {}
+
+
+def _arange(n: int) -> np.ndarray:
+    """Shared read-only arange; the same lengths repeat across tests."""
+    arr = _ARANGE_CACHE.get(n)
+    if arr is None:
+        arr = np.arange(n, dtype=np.int64)
+        arr.setflags(write=False)
+        _ARANGE_CACHE[n] = arr
+    return arr
+
+
 @register_source("stale_test")
 class StaleTestSource(BaseSource):
-    """Test source that returns data ending at a configurable date."""
+    """Test source whose data end date is configured per entry via params."""
 
-    # Class-level config for test control
-    data_end_date: str = "2025-01-02"
+    DEFAULT_END_DATE = "2025-01-02"
 
     def fetch(
         self,
@@ -23,10 +41,13 @@ class StaleTestSource(BaseSource):
         end: str,
         **kwargs: object,
     ) -> pd.DataFrame:
-        """Return test data ending at data_end_date."""
-        dates = pd.date_range(start, self.data_end_date, freq="D")
-        data = {req.symbol: range(len(dates)) for req in requests}
-        return pd.DataFrame(data, index=dates)
+        """Return test data ending at the entry-configured data_end_date."""
+        params = requests[0].params or {}
+        data_end_date = params.get("data_end_date", self.DEFAULT_END_DATE)
+        dates = pd.date_range(start, data_end_date, freq="D")
+        col = _arange(len(dates))
+        data = {req.symbol: col for req in requests}
+        return pd.DataFrame(data, index=dates, copy=False)
 
     def get_metadata(self, symbol: str) -> dict[str, str | None]:
         """Return empty metadata."""
@@ -34,129 +55,110 @@ class StaleTestSource(BaseSource):
 
 
 @pytest.fixture
-def stale_catalog(tmp_path):
-    """Create a test catalog with stale_test source."""
-    catalog_path = tmp_path / "catalog.yaml"
-    catalog_path.write_text("""
+def make_stale_catalog(tmp_path):
+    """Factory for catalogs carrying the data end date in entry params.
+
+    Keeps the configured end date local to each test's catalog instead of
+    mutating shared class state on StaleTestSource.
+    """
+
+    def _make(data_end_date: str):
+        catalog_path = tmp_path / "catalog.yaml"
+        catalog_path.write_text(f"""
 - my_name: test_symbol
   source: stale_test
   symbol: TEST
+  params:
+    data_end_date: "{data_end_date}"
 - my_name: test_symbol2
   source: stale_test
   symbol: TEST2
+  params:
+    data_end_date: "{data_end_date}"
 """)
-    return catalog_path
+        return catalog_path
+
+    return _make
 
 
 class TestStaleDataWarning:
     """Tests for stale data warning behavior."""
 
-    def test_no_warning_when_data_is_current(self, stale_catalog, tmp_path, caplog):
-        """No warning when data ends on the requested end date."""
-        StaleTestSource.data_end_date = "2025-01-02"
-
-        with caplog.at_level(logging.WARNING):
-            with Client(
-                catalog=stale_catalog,
-                cache_path=str(tmp_path / "cache.db"),
-            ) as client:
-                client.get(
-                    ["test_symbol"],
-                    start="2024-01-01",
-                    end="2025-01-02",  # Thursday
-                    use_cache=False,
-                )
-
-        assert "stale_data" not in caplog.text
-
-    def test_no_warning_for_one_business_day_gap(self, stale_catalog, tmp_path, caplog):
-        """No warning when gap is exactly 1 business day (normal T+1)."""
-        # Data ends Friday, request Monday → 1 business day gap
-        StaleTestSource.data_end_date = "2025-01-03"  # Friday
-
-        with caplog.at_level(logging.WARNING):
-            with Client(
-                catalog=stale_catalog,
-                cache_path=str(tmp_path / "cache.db"),
-            ) as client:
-                client.get(
-                    ["test_symbol"],
-                    start="2024-01-01",
-                    end="2025-01-06",  # Monday
-                    use_cache=False,
-                )
-
-        assert "stale_data" not in caplog.text
-
-    def test_warning_for_two_business_day_gap(self, stale_catalog, tmp_path, caplog):
-        """Warning when gap is 2+ business days."""
-        # Data ends Thursday, request Monday → 2 business day gap
-        StaleTestSource.data_end_date = "2025-01-02"  # Thursday
-
-        with caplog.at_level(logging.WARNING):
-            with Client(
-                catalog=stale_catalog,
-                cache_path=str(tmp_path / "cache.db"),
-            ) as client:
-                client.get(
-                    ["test_symbol"],
-                    start="2024-01-01",
-                    end="2025-01-06",  # Monday
-                    use_cache=False,
-                )
-
-        assert "stale_data" in caplog.text
-        assert "test_symbol" in caplog.text
-        assert "actual_end=2025-01-02" in caplog.text
-        assert "requested_end=2025-01-06" in caplog.text
-        assert "gap_bdays=2" in caplog.text
-
-    def test_weekend_handling(self, stale_catalog, tmp_path, caplog):
-        """No false positive when requested end is weekend."""
-        # Data ends Friday, request Sunday → should not warn
-        StaleTestSource.data_end_date = "2025-01-03"  # Friday
-
-        with caplog.at_level(logging.WARNING):
-            with Client(
-                catalog=stale_catalog,
-                cache_path=str(tmp_path / "cache.db"),
-            ) as client:
-                client.get(
-                    ["test_symbol"],
-                    start="2024-01-01",
-                    end="2025-01-05",  # Sunday
-                    use_cache=False,
-                )
-
-        assert "stale_data" not in caplog.text
-
-    def test_multiple_symbols_mixed_freshness(self, stale_catalog, tmp_path, caplog):
+    @pytest.fixture(autouse=True)
+    def _capture_metapyle_warnings(self, caplog):
+        """Capture warnings from the metapyle logger only, not the root logger."""
+        caplog.set_level(logging.WARNING, logger="metapyle")
+
+    @pytest.mark.parametrize(
+        ("data_end", "requested_end", "expect_warn", "gap_bdays"),
+        [
+            # Data ends on the requested end (Thursday): current
+            pytest.param("2025-01-02", "2025-01-02", False, None, id="data-current"),
+            # Data ends Friday, request Monday: 1 business day gap (normal T+1)
+            pytest.param("2025-01-03", "2025-01-06", False, None, id="one-bday-gap"),
+            # Data ends Thursday, request Monday: 2 business day gap
+            pytest.param("2025-01-02", "2025-01-06", True, 2, id="two-bday-gap"),
+            # Data ends Friday, request Sunday: no false positive on weekends
+            pytest.param("2025-01-03", "2025-01-05", False, None, id="weekend-end"),
+        ],
+    )
+    def test_stale_detection(
+        self,
+        make_stale_catalog,
+        tmp_path,
+        caplog,
+        data_end: str,
+        requested_end: str,
+        expect_warn: bool,
+        gap_bdays: int | None,
+    ):
+        """Warn only when the gap to the requested end exceeds 1 business day."""
+        with Client(
+            catalog=make_stale_catalog(data_end),
+            cache_path=str(tmp_path / "cache.db"),
+        ) as client:
+            client.get(
+                ["test_symbol"],
+                start="2024-01-01",
+                end=requested_end,
+                use_cache=False,
+            )
+
+        records = _stale_records(caplog)
+        if expect_warn:
+            assert len(records) == 1
+            message = records[0].getMessage()
+            assert "test_symbol" in message
+            assert f"actual_end={data_end}" in message
+            assert f"requested_end={requested_end}" in message
+            assert f"gap_bdays={gap_bdays}" in message
+        else:
+            assert not records
+
+    def test_multiple_symbols_mixed_freshness(self, make_stale_catalog, tmp_path, caplog):
         """Warning only for stale symbols when fetching multiple."""
         # Need a source that can return different end dates per symbol
         # For simplicity, use same end date but verify warning content
 
-        StaleTestSource.data_end_date = "2025-01-02"  # Thursday
-
-        with caplog.at_level(logging.WARNING):
-            with Client(
-                catalog=stale_catalog,
-                cache_path=str(tmp_path / "cache.db"),
-            ) as client:
-                client.get(
-                    ["test_symbol", "test_symbol2"],
-                    start="2024-01-01",
-                    end="2025-01-06",  # Monday
-                    use_cache=False,
-                )
+        with Client(
+            catalog=make_stale_catalog("2025-01-02"),  # Thursday
+            cache_path=str(tmp_path / "cache.db"),
+        ) as client:
+            client.get(
+                ["test_symbol", "test_symbol2"],
+                start="2024-01-01",
+                end="2025-01-06",  # Monday
+                use_cache=False,
+            )
 
         # Both symbols should have warnings since both are stale
-        assert caplog.text.count("stale_data") == 2
-        assert "test_symbol" in caplog.text
-        assert "test_symbol2" in caplog.text
+        records = _stale_records(caplog)
+        assert len(records) == 2
+        assert {r.args[0] for r in records} == {"test_symbol", "test_symbol2"}
 
-    def test_no_warning_on_cache_hit(self, stale_catalog, tmp_path, caplog):
+    def test_no_warning_on_cache_hit(self, make_stale_catalog, tmp_path, caplog):
         """No warning when data is served from cache (can't detect staleness)."""
-        StaleTestSource.data_end_date = "2025-01-02"  # Stale data
+        stale_catalog = make_stale_catalog("2025-01-02")  # Stale data
 
         with Client(
             catalog=stale_catalog,
@@ -173,17 +175,16 @@ class TestStaleDataWarning:
         # Clear log, fetch again from cache
         caplog.clear()
 
-        with caplog.at_level(logging.WARNING):
-            with Client(
-                catalog=stale_catalog,
-                cache_path=str(tmp_path / "cache.db"),
-            ) as client:
-                client.get(
-                    ["test_symbol"],
-                    start="2024-01-01",
-                    end="2025-01-06",
-                    use_cache=True,
-                )
+        with Client(
+            catalog=stale_catalog,
+            cache_path=str(tmp_path / "cache.db"),
+        ) as client:
+            client.get(
+                ["test_symbol"],
+                start="2024-01-01",
+                end="2025-01-06",
+                use_cache=True,
+            )
 
         # No warning on cache hit
-        assert "stale_data" not in caplog.text
+        assert not _stale_records(caplog)
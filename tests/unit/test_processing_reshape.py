@@ -0,0 +1,146 @@
+"""Tests for the wide-to-long reshape and Client output formats."""
+
+import pandas as pd
+import pytest
+
+from metapyle import Client
+from metapyle.processing import wide_to_long
+from metapyle.sources.base import BaseSource, FetchRequest, register_source
+
+# Immutable indexes shared across tests; date_range + tz localization is the
+# dominant cost of building these tiny input frames.
+_IDX_2D_UTC = pd.date_range("2024-01-01", periods=2, freq="D", tz="UTC")
+_IDX_3D_UTC = pd.date_range("2024-01-01", periods=3, freq="D", tz="UTC")
+
+
+@pytest.fixture(scope="module")
+def wide_df() -> pd.DataFrame:
+    """Two-symbol wide frame shared across reshape tests (read-only)."""
+    return pd.DataFrame(
+        {
+            "SPX": [100, 101, 102],
+            "VIX": [15, 16, 17],
+        },
+        index=_IDX_3D_UTC,
+    )
+
+
+class TestWideToLong:
+    """Tests for wide_to_long."""
+
+    def test_basic_conversion(self, wide_df: pd.DataFrame) -> None:
+        """Basic wide to long conversion."""
+        result = wide_to_long(wide_df)
+
+        assert len(result) == 6  # 3 dates * 2 symbols
+        assert list(result.columns) == ["date", "symbol", "value"]
+        assert sorted(pd.unique(result["symbol"].to_numpy())) == ["SPX", "VIX"]
+
+    def test_preserves_data_values(self) -> None:
+        """Values are correctly preserved in long format."""
+        df = pd.DataFrame(
+            {
+                "A": [1.0, 2.0],
+                "B": [3.0, 4.0],
+            },
+            index=_IDX_2D_UTC,
+        )
+
+        result = wide_to_long(df)
+
+        # Single pass over the value column instead of one mask per symbol
+        groups = dict(iter(result.groupby("symbol", sort=False, observed=True)["value"]))
+        assert groups["A"].tolist() == [1.0, 2.0]
+        assert groups["B"].tolist() == [3.0, 4.0]
+
+    def test_custom_column_names(self) -> None:
+        """Custom column names can be specified."""
+        df = pd.DataFrame(
+            {"X": [1, 2]},
+            index=_IDX_2D_UTC,
+        )
+
+        result = wide_to_long(
+            df,
+            date_col="timestamp",
+            symbol_col="ticker",
+            value_col="price",
+        )
+
+        assert list(result.columns) == ["timestamp", "ticker", "price"]
+
+    def test_empty_dataframe(self) -> None:
+        """Empty DataFrame returns empty long DataFrame."""
+        df = pd.DataFrame(index=pd.DatetimeIndex([], name="date"))
+
+        result = wide_to_long(df)
+
+        assert len(result) == 0
+        assert list(result.columns) == ["date", "symbol", "value"]
+
+
+_RESHAPE_FRAME = pd.DataFrame(
+    {"a": [1, 2, 3], "b": [2, 4, 6]},
+    index=pd.date_range("2024-01-01", periods=3, freq="D"),
+)
+
+
+@register_source("reshape_test")
+class ReshapeTestSource(BaseSource):
+    """In-memory source serving slices of a fixed two-column frame."""
+
+    def fetch(
+        self,
+        requests: list[FetchRequest],
+        start: str,
+        end: str,
+        **kwargs: object,
+    ) -> pd.DataFrame:
+        """Return the requested symbols over [start, end]."""
+        return _RESHAPE_FRAME.loc[start:end, [req.symbol for req in requests]]
+
+    def get_metadata(self, symbol: str) -> dict[str, str | None]:
+        """Return empty metadata."""
+        return {}
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Client over the in-memory test source; no filesystem I/O involved."""
+    entries = [
+        {"my_name": "alpha", "source": "reshape_test", "symbol": "a"},
+        {"my_name": "beta", "source": "reshape_test", "symbol": "b"},
+    ]
+    with Client.from_entries(entries, cache_enabled=False) as client:
+        yield client
+
+
+class TestClientOutputFormat:
+    """Tests for Client.get() output_format parameter."""
+
+    def test_default_wide_format(self, client: Client) -> None:
+        """Default output format is wide."""
+        df = client.get(["alpha", "beta"], start="2024-01-01", end="2024-01-03")
+
+        # Wide format: columns are symbol names
+        assert list(df.columns) == ["alpha", "beta"]
+        assert len(df) == 3
+
+    def test_long_format(self, client: Client) -> None:
+        """output_format='long' returns melted DataFrame."""
+        df = client.get(
+            ["alpha", "beta"],
+            start="2024-01-01",
+            end="2024-01-03",
+            output_format="long",
+        )
+
+        # Long format: date, symbol, value columns
+        assert list(df.columns) == ["date", "symbol", "value"]
+        assert len(df) == 6  # 3 dates * 2 symbols
+        assert sorted(pd.unique(df["symbol"].to_numpy())) == ["alpha", "beta"]
+
+    def test_invalid_output_format_raises(self, client: Client) -> None:
+        """Invalid output_format raises ValueError."""
+        with pytest.raises(ValueError, match="output_format must be"):
+            client.get(["alpha"], start="2024-01-01", end="2024-01-03", output_format="invalid")
@@ -1,6 +1,6 @@
 """Tests for BloombergSource."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pandas as pd
 import pytest
@@ -9,6 +9,10 @@ from metapyle.exceptions import FetchError, NoDataError
 from metapyle.sources.base import FetchRequest
 from metapyle.sources.bloomberg import BloombergSource
 
+# Parsed once and shared by the mock-frame fixtures below
+_DATES_1 = pd.to_datetime(["2024-01-01"])
+_DATES_2 = pd.to_datetime(["2024-01-01", "2024-01-02"])
+
 
 @pytest.fixture
 def source() -> BloombergSource:
@@ -16,118 +20,140 @@ def source() -> BloombergSource:
     return BloombergSource()
 
 
+@pytest.fixture(autouse=True)
+def mock_blp(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Patch _get_blp once per test with a reusable mock xbbg client."""
+    blp = MagicMock()
+    monkeypatch.setattr("metapyle.sources.bloomberg._get_blp", lambda: blp)
+    return blp
+
+
+@pytest.fixture(scope="module")
+def spx_px_last_df() -> pd.DataFrame:
+    """Two-row SPX PX_LAST frame as bdh would return it."""
+    return pd.DataFrame(
+        [[100.0], [101.0]],
+        index=_DATES_2,
+        columns=pd.MultiIndex.from_tuples([("SPX Index", "PX_LAST")]),
+    )
+
+
+@pytest.fixture(scope="module")
+def multi_symbol_df() -> pd.DataFrame:
+    """Frame with PX_LAST for two symbols."""
+    return pd.DataFrame(
+        [[100.0, 200.0], [101.0, 201.0]],
+        index=_DATES_2,
+        columns=pd.MultiIndex.from_tuples(
+            [
+                ("SPX Index", "PX_LAST"),
+                ("AAPL US Equity", "PX_LAST"),
+            ]
+        ),
+    )
+
+
+@pytest.fixture(scope="module")
+def multi_field_df() -> pd.DataFrame:
+    """Frame with two fields for one symbol."""
+    return pd.DataFrame(
+        [[100.0, 105.0], [101.0, 106.0]],
+        index=_DATES_2,
+        columns=pd.MultiIndex.from_tuples(
+            [
+                ("SPX Index", "PX_LAST"),
+                ("SPX Index", "PX_HIGH"),
+            ]
+        ),
+    )
+
+
+@pytest.fixture(scope="module")
+def spx_single_row_df() -> pd.DataFrame:
+    """One-row SPX PX_LAST frame.
+
+    Module scope is safe because bdh is mocked and tests only read the frame.
+    """
+    return pd.DataFrame(
+        [[100.0]],
+        index=_DATES_1,
+        columns=pd.MultiIndex.from_tuples([("SPX Index", "PX_LAST")]),
+    )
+
+
 class TestBloombergSourceFetch:
     """Tests for BloombergSource.fetch()."""
 
-    def test_single_request(self, source: BloombergSource) -> None:
+    def test_single_request(
+        self, source: BloombergSource, mock_blp: MagicMock, spx_px_last_df: pd.DataFrame
+    ) -> None:
         """Fetch single symbol with field."""
-        mock_df = pd.DataFrame(
-            {"PX_LAST": [100.0, 101.0]},
-            index=pd.to_datetime(["2024-01-01", "2024-01-02"]),
-        )
-        mock_df.columns = pd.MultiIndex.from_tuples([("SPX Index", "PX_LAST")])
+        mock_blp.bdh.return_value = spx_px_last_df
 
-        with patch("metapyle.sources.bloomberg._get_blp") as mock_get_blp:
-            mock_blp = MagicMock()
-            mock_blp.bdh.return_value = mock_df
-            mock_get_blp.return_value = mock_blp
+        requests = [FetchRequest(symbol="SPX Index", field="PX_LAST")]
+        df = source.fetch(requests, "2024-01-01", "2024-01-02")
 
-            requests = [FetchRequest(symbol="SPX Index", field="PX_LAST")]
-            df = source.fetch(requests, "2024-01-01", "2024-01-02")
+        assert list(df.columns) == ["SPX Index::PX_LAST"]
+        assert len(df) == 2
 
-            assert list(df.columns) == ["SPX Index::PX_LAST"]
-            assert len(df) == 2
-
-    def test_multiple_requests_same_field(self, source: BloombergSource) -> None:
+    def test_multiple_requests_same_field(
+        self, source: BloombergSource, mock_blp: MagicMock, multi_symbol_df: pd.DataFrame
+    ) -> None:
         """Fetch multiple symbols with same field."""
-        mock_df = pd.DataFrame(
-            [[100.0, 200.0], [101.0, 201.0]],
-            index=pd.to_datetime(["2024-01-01", "2024-01-02"]),
-            columns=pd.MultiIndex.from_tuples(
-                [
-                    ("SPX Index", "PX_LAST"),
-                    ("AAPL US Equity", "PX_LAST"),
-                ]
-            ),
-        )
-
-        with patch("metapyle.sources.bloomberg._get_blp") as mock_get_blp:
-            mock_blp = MagicMock()
-            mock_blp.bdh.return_value = mock_df
-            mock_get_blp.return_value = mock_blp
-
-            requests = [
-                FetchRequest(symbol="SPX Index", field="PX_LAST"),
-                FetchRequest(symbol="AAPL US Equity", field="PX_LAST"),
-            ]
-            df = source.fetch(requests, "2024-01-01", "2024-01-02")
+        mock_blp.bdh.return_value = multi_symbol_df
 
-            assert "SPX Index::PX_LAST" in df.columns
-            assert "AAPL US Equity::PX_LAST" in df.columns
-            mock_blp.bdh.assert_called_once()
+        requests = [
+            FetchRequest(symbol="SPX Index", field="PX_LAST"),
+            FetchRequest(symbol="AAPL US Equity", field="PX_LAST"),
+        ]
+        df = source.fetch(requests, "2024-01-01", "2024-01-02")
 
-    def test_multiple_fields_same_symbol(self, source: BloombergSource) -> None:
+        assert "SPX Index::PX_LAST" in df.columns
+        assert "AAPL US Equity::PX_LAST" in df.columns
+        mock_blp.bdh.assert_called_once()
+
+    def test_multiple_fields_same_symbol(
+        self, source: BloombergSource, mock_blp: MagicMock, multi_field_df: pd.DataFrame
+    ) -> None:
         """Fetch multiple fields for same symbol."""
-        mock_df = pd.DataFrame(
-            [[100.0, 105.0], [101.0, 106.0]],
-            index=pd.to_datetime(["2024-01-01", "2024-01-02"]),
-            columns=pd.MultiIndex.from_tuples(
-                [
-                    ("SPX Index", "PX_LAST"),
-                    ("SPX Index", "PX_HIGH"),
-                ]
-            ),
-        )
-
-        with patch("metapyle.sources.bloomberg._get_blp") as mock_get_blp:
-            mock_blp = MagicMock()
-            mock_blp.bdh.return_value = mock_df
-            mock_get_blp.return_value = mock_blp
-
-            requests = [
-                FetchRequest(symbol="SPX Index", field="PX_LAST"),
-                FetchRequest(symbol="SPX Index", field="PX_HIGH"),
-            ]
-            df = source.fetch(requests, "2024-01-01", "2024-01-02")
+        mock_blp.bdh.return_value = multi_field_df
 
-            assert "SPX Index::PX_LAST" in df.columns
-            assert "SPX Index::PX_HIGH" in df.columns
+        requests = [
+            FetchRequest(symbol="SPX Index", field="PX_LAST"),
+            FetchRequest(symbol="SPX Index", field="PX_HIGH"),
+        ]
+        df = source.fetch(requests, "2024-01-01", "2024-01-02")
 
-    def test_default_field(self, source: BloombergSource) -> None:
-        """Use PX_LAST as default field when not specified."""
-        mock_df = pd.DataFrame(
-            {"PX_LAST": [100.0]},
-            index=pd.to_datetime(["2024-01-01"]),
-        )
-        mock_df.columns = pd.MultiIndex.from_tuples([("SPX Index", "PX_LAST")])
+        assert "SPX Index::PX_LAST" in df.columns
+        assert "SPX Index::PX_HIGH" in df.columns
 
-        with patch("metapyle.sources.bloomberg._get_blp") as mock_get_blp:
-            mock_blp = MagicMock()
-            mock_blp.bdh.return_value = mock_df
-            mock_get_blp.return_value = mock_blp
+    def test_default_field(
+        self, source: BloombergSource, mock_blp: MagicMock, spx_single_row_df: pd.DataFrame
+    ) -> None:
+        """Use PX_LAST as default field when not specified."""
+        mock_blp.bdh.return_value = spx_single_row_df
 
-            requests = [FetchRequest(symbol="SPX Index")]  # no field
-            df = source.fetch(requests, "2024-01-01", "2024-01-01")
+        requests = [FetchRequest(symbol="SPX Index")]  # no field
+        df = source.fetch(requests, "2024-01-01", "2024-01-01")
 
-            assert "SPX Index::PX_LAST" in df.columns
+        assert "SPX Index::PX_LAST" in df.columns
 
-    def test_xbbg_not_available(self, source: BloombergSource) -> None:
+    def test_xbbg_not_available(
+        self, source: BloombergSource, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Raise FetchError when xbbg not installed."""
-        with patch("metapyle.sources.bloomberg._get_blp", return_value=None):
-            requests = [FetchRequest(symbol="SPX Index", field="PX_LAST")]
-            with pytest.raises(FetchError, match="xbbg"):
-                source.fetch(requests, "2024-01-01", "2024-01-02")
+        monkeypatch.setattr("metapyle.sources.bloomberg._get_blp", lambda: None)
+        requests = [FetchRequest(symbol="SPX Index", field="PX_LAST")]
+        with pytest.raises(FetchError, match="xbbg"):
+            source.fetch(requests, "2024-01-01", "2024-01-02")
 
-    def test_empty_result_raises(self, source: BloombergSource) -> None:
+    def test_empty_result_raises(self, source: BloombergSource, mock_blp: MagicMock) -> None:
         """Raise NoDataError when Bloomberg returns empty."""
-        with patch("metapyle.sources.bloomberg._get_blp") as mock_get_blp:
-            mock_blp = MagicMock()
-            mock_blp.bdh.return_value = pd.DataFrame()
-            mock_get_blp.return_value = mock_blp
+        mock_blp.bdh.return_value = pd.DataFrame()
 
-            requests = [FetchRequest(symbol="INVALID", field="PX_LAST")]
-            with pytest.raises(NoDataError):
-                source.fetch(requests, "2024-01-01", "2024-01-02")
+        requests = [FetchRequest(symbol="INVALID", field="PX_LAST")]
+        with pytest.raises(NoDataError):
+            source.fetch(requests, "2024-01-01", "2024-01-02")
 
 
 class TestBloombergSourceGetMetadata:
@@ -135,34 +161,26 @@ class TestBloombergSourceGetMetadata:
 
     def test_metadata(self, source: BloombergSource) -> None:
         """get_metadata returns basic info."""
-        with patch("metapyle.sources.bloomberg._get_blp"):
-            meta = source.get_metadata("SPX Index")
-            assert meta["source"] == "bloomberg"
-            assert meta["symbol"] == "SPX Index"
+        meta = source.get_metadata("SPX Index")
+        assert meta["source"] == "bloomberg"
+        assert meta["symbol"] == "SPX Index"
 
 
 class TestBloombergSourceKwargs:
     """Tests for **kwargs handling in BloombergSource."""
 
-    def test_fetch_ignores_kwargs(self, source: BloombergSource) -> None:
+    def test_fetch_ignores_kwargs(
+        self, source: BloombergSource, mock_blp: MagicMock, spx_single_row_df: pd.DataFrame
+    ) -> None:
         """BloombergSource.fetch() accepts and ignores **kwargs."""
-        mock_df = pd.DataFrame(
-            {("SPX Index", "PX_LAST"): [100.0]},
-            index=pd.to_datetime(["2024-01-01"]),
-        )
-        mock_df.columns = pd.MultiIndex.from_tuples([("SPX Index", "PX_LAST")])
-
-        with patch("metapyle.sources.bloomberg._get_blp") as mock_get_blp:
-            mock_blp = MagicMock()
-            mock_blp.bdh.return_value = mock_df
-            mock_get_blp.return_value = mock_blp
-
-            requests = [FetchRequest(symbol="SPX Index", field="PX_LAST")]
-            # Pass kwargs that should be ignored
-            df = source.fetch(requests, "2024-01-01", "2024-01-01", unified=True, currency="EUR")
-
-            assert not df.empty
-            mock_blp.bdh.assert_called_once()
+        mock_blp.bdh.return_value = spx_single_row_df
+
+        requests = [FetchRequest(symbol="SPX Index", field="PX_LAST")]
+        # Pass kwargs that should be ignored
+        df = source.fetch(requests, "2024-01-01", "2024-01-01", unified=True, currency="EUR")
+
+        assert not df.empty
+        mock_blp.bdh.assert_called_once()
 
 
 class TestBloombergSourceIsRegistered: